@@ -8,12 +8,14 @@ import sys
 import subprocess
 from pathlib import Path
 
+_BAR = "=" * 60
+_BANNER_BUILD = f"{_BAR}\nECOWAS Application Processor - Build Script\n{_BAR}"
+_BANNER_DONE = f"\n{_BAR}\nBuild Complete!\n{_BAR}"
+
 def build_executable():
     """Build standalone executable using PyInstaller."""
     
-    print("=" * 60)
-    print("ECOWAS Application Processor - Build Script")
-    print("=" * 60)
+    print(_BANNER_BUILD)
     
     # Check if PyInstaller is installed
     try:
@@ -63,9 +65,7 @@ def build_executable():
         result = subprocess.run(cmd, check=True, capture_output=True, text=True)
         print(result.stdout)
         
-        print("\n" + "=" * 60)
-        print("Build Complete!")
-        print("=" * 60)
+        print(_BANNER_DONE)
         print(f"\nExecutable location: dist/ECOWAS-Application-Processor.exe")
         print("\nNext steps:")
         print("1. Test the executable")
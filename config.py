@@ -33,6 +33,7 @@ EXCEL_HEADERS = [
     'S/N', 'NAME', 'POSITION CODE', 'GENDER', 'INT/EXT', 'DOB', 
     'AGE', 'NATIONALITY', 'EXP START (YEAR)', 'EXPERIENCE(Years)', 'QUALIFICATIONS'
 ]
+EXCEL_STREAMING_THRESHOLD = 2 * 1024 * 1024  # Files larger than this (bytes) offer a lossy write-only sync
 
 # Default values for constant fields
 DEFAULT_POSITION_CODE = "ACCTRE_25EXT"
@@ -3,12 +3,15 @@ Excel export functionality for offline use.
 """
 
 import os
+import shutil
+import tempfile
 from pathlib import Path
 from typing import List, Dict, Optional
 import logging
 
 try:
     from openpyxl import load_workbook, Workbook
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Font, PatternFill, Alignment
 except ImportError:
     load_workbook = None
@@ -142,6 +145,154 @@ class ExcelExporter:
         except PermissionError:
              raise PermissionError("Could not save Excel file. Is it open in another program?")
     
+    def write_only_append(self, excel_path: str, data_rows: List[Dict]) -> Dict:
+        """
+        Streaming variant of append_to_excel for large workbooks.
+        
+        Existing rows are read with a read-only workbook and streamed, together
+        with the updated/appended rows, into a write-only workbook (lxml backed
+        when available), so memory stays flat regardless of row count. The
+        result is written to a temporary file and renamed over the original.
+        
+        Rows are matched and placed exactly as append_to_excel does: named rows
+        are updated, rows with an empty NAME cell are copied unchanged, and new
+        applicants fill the rows after the last named row (keeping any other
+        values already there). Only cell values survive the copy, though: cell
+        styles, column widths, merged cells, conditional formats, freeze panes,
+        filters, comments and charts of the original workbook are all lost.
+        The header row keeps its text and gets the standard header style, and
+        qualifications keep their wrap alignment. Callers should only take this
+        path with the user's consent; the file's permission bits are kept.
+        """
+        excel_path = Path(excel_path)
+        
+        # Index the incoming rows by normalized name (last one wins, as in append_to_excel)
+        updates = {}
+        for data in data_rows:
+            applicant_name = data.get('fields', {}).get('NAME', '').strip().upper()
+            if applicant_name:
+                updates[applicant_name] = data.get('fields', {})
+        
+        src = load_workbook(excel_path, read_only=True)
+        target_name = self.sheet_name if self.sheet_name in src.sheetnames else src.active.title
+        
+        wb = Workbook(write_only=True)
+        matched = set()
+        rows_updated = 0
+        rows_appended = 0
+        
+        try:
+            for sheet_name in src.sheetnames:
+                src_ws = src[sheet_name]
+                ws = wb.create_sheet(title=sheet_name)
+                
+                if sheet_name != target_name:
+                    for row in src_ws.iter_rows(values_only=True):
+                        ws.append(list(row))
+                    continue
+                
+                last_data_row = 1
+                unnamed_rows = []  # Rows without a NAME since the last named row
+                
+                for row_idx, row in enumerate(src_ws.iter_rows(max_col=11, values_only=True), start=1):
+                    values = list(row) + [None] * (11 - len(row))
+                    
+                    if row_idx == 1:
+                        ws.append(self._header_cells(ws, values))
+                        continue
+                    
+                    if not values[1]:
+                        # Held back: rows after the last named row take new applicants
+                        unnamed_rows.append(values)
+                        continue
+                    
+                    for held in unnamed_rows:
+                        ws.append(held)
+                    unnamed_rows = []
+                    
+                    name_key = str(values[1]).strip().upper()
+                    if name_key in updates:
+                        self._merge_fields(values, updates[name_key])
+                        matched.add(name_key)
+                        rows_updated += 1
+                    
+                    ws.append(self._row_cells(ws, values))
+                    last_data_row = row_idx
+                
+                # Append rows whose name was not found in the sheet
+                for data in data_rows:
+                    fields = data.get('fields', {})
+                    applicant_name = fields.get('NAME', '').strip().upper()
+                    if not applicant_name or applicant_name in matched:
+                        continue
+                    
+                    last_data_row += 1
+                    rows_appended += 1
+                    # Like append_to_excel, write into the next row, keeping cells the fields don't set
+                    values = unnamed_rows.pop(0) if unnamed_rows else [None] * 11
+                    values[0] = last_data_row - 1
+                    values[1] = applicant_name
+                    self._merge_fields(values, fields)
+                    ws.append(self._row_cells(ws, values))
+                
+                for held in unnamed_rows:
+                    ws.append(held)
+        finally:
+            src.close()
+        
+        # Save to a temporary file next to the target, then swap it in
+        fd, tmp_path = tempfile.mkstemp(suffix='.xlsx', dir=str(excel_path.parent))
+        os.close(fd)
+        try:
+            wb.save(tmp_path)
+            # mkstemp creates the file owner-only; keep the original's mode
+            shutil.copymode(excel_path, tmp_path)
+            os.replace(tmp_path, excel_path)
+        except PermissionError:
+            raise PermissionError("Could not save Excel file. Is it open in another program?")
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        
+        logger.info(f"Streaming sync complete. Updated {rows_updated} rows and appended {rows_appended} rows")
+        return {
+            'rows_added': rows_updated + rows_appended,
+            'rows_updated': rows_updated,
+            'rows_appended': rows_appended,
+            'file_path': str(excel_path),
+        }
+    
+    def _merge_fields(self, values: List, fields: Dict):
+        """Apply extracted fields to a row of 11 cell values (same rules as append_to_excel)."""
+        if fields.get('POSITION CODE'):
+            values[2] = fields.get('POSITION CODE')
+        values[3] = fields.get('GENDER', '')
+        if fields.get('INT/EXT'):
+            values[4] = fields.get('INT/EXT')
+        values[5] = fields.get('DOB', '')
+        values[6] = fields.get('AGE', '')
+        values[7] = fields.get('NATIONALITY', '')
+        values[8] = fields.get('EXP START (YEAR)', '')
+        values[9] = fields.get('EXPERIENCE(Years)', '')
+        values[10] = fields.get('QUALIFICATIONS', '')
+    
+    def _row_cells(self, worksheet, values: List) -> List:
+        """Build a write-only data row, keeping the wrap alignment on qualifications."""
+        qual_cell = WriteOnlyCell(worksheet, value=values[10])
+        qual_cell.alignment = Alignment(wrap_text=True, vertical="top")
+        return values[:10] + [qual_cell]
+    
+    def _header_cells(self, worksheet, values: List) -> List:
+        """Build the formatted header row for a write-only worksheet from the existing header values."""
+        cells = []
+        for header in values:
+            cell = WriteOnlyCell(worksheet, value=header)
+            cell.font = Font(bold=True, color="FFFFFF")
+            cell.fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+            cell.alignment = Alignment(horizontal="center", vertical="center")
+            cells.append(cell)
+        return cells
+    
     def _write_header(self, worksheet):
         """Write header row with formatting."""
         for idx, header in enumerate(self.HEADER_ROW, start=1):
@@ -151,7 +302,10 @@ class ExcelExporter:
             cell.fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
             cell.alignment = Alignment(horizontal="center", vertical="center")
         
-        # Set column widths
+        self._set_column_widths(worksheet)
+    
+    def _set_column_widths(self, worksheet):
+        """Set column widths for the standard layout."""
         col_widths = {
             'A': 8,   # S/N
             'B': 25,  # NAME
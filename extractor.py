@@ -3,6 +3,7 @@ Document extraction module for ECOWAS Application Processor.
 Handles PDF, DOCX, and OCR-based text extraction.
 """
 
+import importlib
 import os
 import re
 import logging
@@ -10,32 +11,29 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
 
-try:
-    import pdfplumber
-except ImportError:
-    pdfplumber = None
-
-try:
-    from docx import Document
-except ImportError:
-    Document = None
+from config import TESSERACT_PATH
 
-try:
-    import pytesseract
-    from PIL import Image
-except ImportError:
-    pytesseract = None
-    Image = None
 
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
-from config import TESSERACT_PATH
 
-if pytesseract and os.path.exists(TESSERACT_PATH):
-    pytesseract.pytesseract.tesseract_cmd = TESSERACT_PATH
+# Parsing/OCR libraries are heavy to import, so they are loaded on first use
+# rather than when the GUI starts. None marks a module that isn't installed.
+_optional_modules: Dict[str, Any] = {}
 
 
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+def _optional_import(name: str):
+    """Import an optional dependency once; returns None if it is not installed."""
+    if name not in _optional_modules:
+        try:
+            module = importlib.import_module(name)
+        except ImportError:
+            module = None
+        if name == 'pytesseract' and module and os.path.exists(TESSERACT_PATH):
+            module.pytesseract.tesseract_cmd = TESSERACT_PATH
+        _optional_modules[name] = module
+    return _optional_modules[name]
 
 
 class FieldExtractor:
@@ -73,6 +71,20 @@ class FieldExtractor:
         from config import DEFAULT_POSITION_CODE, DEFAULT_INT_EXT
         self.default_position_code = DEFAULT_POSITION_CODE
         self.default_int_ext = DEFAULT_INT_EXT
+        
+        # Empty field set with the constant defaults filled in; copy before use
+        self.default_fields = {
+            'NAME': '',
+            'POSITION CODE': self.default_position_code,
+            'GENDER': '',
+            'INT/EXT': self.default_int_ext,
+            'DOB': '',
+            'AGE': '',
+            'NATIONALITY': '',
+            'EXP START (YEAR)': '',
+            'EXPERIENCE(Years)': '',
+            'QUALIFICATIONS': '',
+        }
     
     def extract_from_file(self, file_path: str) -> Dict:
         """
@@ -133,6 +145,7 @@ class FieldExtractor:
     
     def _extract_pdf(self, file_path: Path) -> str:
         """Extract text from PDF file."""
+        pdfplumber = _optional_import('pdfplumber')
         if not pdfplumber:
             raise ImportError("pdfplumber not installed")
         
@@ -144,7 +157,7 @@ class FieldExtractor:
                 num_pages = len(pdf.pages)
                 pages_to_process = min(num_pages, PDF_MAX_PAGES)
                 
-                logger.info(f"Extracting text from PDF: {file_path.name} ({pages_to_process}/{num_pages} pages)")
+                logger.info("Extracting text from PDF: %s (%d/%d pages)", file_path.name, pages_to_process, num_pages)
                 
                 for i in range(pages_to_process):
                     page = pdf.pages[i]
@@ -156,15 +169,17 @@ class FieldExtractor:
             return ""
         
         # If no text extracted, try OCR
-        if not text.strip() and pytesseract:
-            logger.info(f"No text found in {file_path.name}, attempting OCR...")
+        if not text.strip() and _optional_import('pytesseract'):
+            logger.info("No text found in %s, attempting OCR...", file_path.name)
             text = self._extract_pdf_with_ocr(file_path)
         
         return text
     
     def _extract_pdf_with_ocr(self, file_path: Path) -> str:
         """Extract text from PDF using OCR."""
-        if not pytesseract or not Image:
+        pdfplumber = _optional_import('pdfplumber')
+        pytesseract = _optional_import('pytesseract')
+        if not pytesseract or not _optional_import('PIL.Image'):
             return ""
         
         text = ""
@@ -176,7 +191,7 @@ class FieldExtractor:
                 pages_to_process = min(num_pages, PDF_MAX_PAGES)
                 
                 for i in range(pages_to_process):
-                    logger.info(f"OCR-ing page {i+1}/{pages_to_process} of {file_path.name}...")
+                    logger.info("OCR-ing page %d/%d of %s...", i + 1, pages_to_process, file_path.name)
                     page = pdf.pages[i]
                     # Convert page to image
                     img = page.to_image(resolution=300)
@@ -186,7 +201,7 @@ class FieldExtractor:
                         page_text = pytesseract.image_to_string(pil_img, timeout=60)
                         text += page_text + "\n"
                     except RuntimeError as re:
-                         logger.warning(f"OCR timeout/error on page {i+1} of {file_path.name}: {re}")
+                         logger.warning("OCR timeout/error on page %d of %s: %s", i + 1, file_path.name, re)
         except Exception as e:
             logger.error(f"OCR failed for {file_path.name}: {e}")
             
@@ -194,10 +209,11 @@ class FieldExtractor:
     
     def _extract_docx(self, file_path: Path) -> Dict:
         """Extract text and structured data from DOCX file."""
-        if not Document:
+        docx = _optional_import('docx')
+        if not docx:
             raise ImportError("python-docx not installed")
         
-        doc = Document(file_path)
+        doc = docx.Document(file_path)
         text = "\n".join([para.text for para in doc.paragraphs])
         
         # Also extract text from tables for legacy pattern matching
@@ -320,6 +336,8 @@ class FieldExtractor:
     
     def _extract_image(self, file_path: Path) -> str:
         """Extract text from image using OCR."""
+        pytesseract = _optional_import('pytesseract')
+        Image = _optional_import('PIL.Image')
         if not pytesseract or not Image:
             raise ImportError("pytesseract and Pillow not installed")
         
@@ -332,18 +350,7 @@ class FieldExtractor:
         today = datetime.now()
         current_year = today.year
         
-        fields = {
-            'NAME': '',
-            'POSITION CODE': self.default_position_code,
-            'GENDER': '',
-            'INT/EXT': self.default_int_ext,
-            'DOB': '',
-            'AGE': '',
-            'NATIONALITY': '',
-            'EXP START (YEAR)': '',
-            'EXPERIENCE(Years)': '',
-            'QUALIFICATIONS': '',
-        }
+        fields = self.default_fields.copy()
         
         confidence = {k: 0.0 for k in fields.keys()}
         confidence['POSITION CODE'] = 1.0
@@ -4,17 +4,23 @@ Main GUI application for ECOWAS Application Processor.
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
+from bisect import bisect_left
+from collections import deque
+import asyncio
+import atexit
+import multiprocessing
 import threading
 import logging
 import os
+import queue
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Sequence
 import json
 from datetime import datetime
 
+import config
 from processor import ApplicationProcessor
 from exporter import ExcelExporter
-from PIL import Image, ImageTk
 
 # Try to import ttkthemes for better styling
 try:
@@ -36,7 +42,9 @@ logger = logging.getLogger(__name__)
 
 
 import sys
+import functools
 
+@functools.lru_cache(maxsize=64)
 def resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
     try:
@@ -51,23 +59,57 @@ def resource_path(relative_path):
 class ApplicationGUI:
     """Main GUI application."""
     
+    # Results table columns
+    _COLUMNS = (
+        'S/N', 'NAME', 'POSITION CODE', 'GENDER', 
+        'INT/EXT', 'DOB', 'AGE', 'NATIONALITY', 'EXP START', 'EXPERIENCE', 'QUALIFICATIONS', 'Status'
+    )
+    
+    # Table column -> result field key for the editable data columns
+    _COLUMN_TO_FIELD = {
+        'NAME': 'NAME',
+        'POSITION CODE': 'POSITION CODE',
+        'GENDER': 'GENDER',
+        'INT/EXT': 'INT/EXT',
+        'DOB': 'DOB',
+        'AGE': 'AGE',
+        'NATIONALITY': 'NATIONALITY',
+        'EXP START': 'EXP START (YEAR)',
+        'EXPERIENCE': 'EXPERIENCE(Years)',
+        'QUALIFICATIONS': 'QUALIFICATIONS',
+    }
+    
+    # Row tags by extraction status; anything else is tagged 'error'
+    _STATUS_TAG = {'success': (), 'no_form': ('warning',)}
+    
+    # Column indices that can't be edited: 0=S/N, 11=Status
+    _NON_EDITABLE = frozenset({0, 11})
+    
+    # Columns sorted by their numeric value rather than their text
+    _NUMERIC_COLUMNS = frozenset({'S/N', 'AGE', 'EXP START', 'EXPERIENCE'})
+    _DOB_FORMATS = ('%d %B %Y', '%Y-%m-%d')  # As written by the extractor, then ISO
+    
+    FILTER_DEBOUNCE_MS = 100  # Filter is applied once toggling settles
+    
+    STATUS_RESET_MS = 3000  # How long the completion summary stays in the status line
+    
+    UI_POLL_MS = 50  # How often worker-side updates are applied on the Tk thread
+    UI_POLL_BATCH = 100  # Max queued callbacks handled per poll
+    
+    HISTORY_FILE = "processing_history.txt"
+    HISTORY_TAIL_BYTES = 256 * 1024  # Only the most recent history is shown at startup
+    HISTORY_MAX_LINES = 500  # History pane keeps only this many lines
+    
     def __init__(self):
         if THEMES_AVAILABLE:
             self.root = ThemedTk(theme="arc")
         else:
             self.root = tk.Tk()
         
-        import config
         self.root.title(config.APP_NAME)
         
-        # Set window icon
-        try:
-            icon_path = Path(resource_path("logo_square.png"))
-            if icon_path.exists():
-                self.icon_photo = tk.PhotoImage(file=str(icon_path))
-                self.root.iconphoto(True, self.icon_photo)
-        except Exception as e:
-            logger.error(f"Could not load icon: {e}")
+        # Window icon is loaded once the window has been drawn
+        self.root.after_idle(self._deferred_setup)
 
         # Calculate position to center the window
         width = 900
@@ -81,12 +123,27 @@ class ApplicationGUI:
         self.root.minsize(800, 500)
         
         # Initialize components
-        self.processor = ApplicationProcessor(max_workers=4)
+        self.processor = ApplicationProcessor(max_workers=os.cpu_count() or 4, executor_mode='auto')
         self.excel_exporter = ExcelExporter()
         
+        # Dedicated event loop for batch processing, kept off the Tk thread
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        
         # Data
         self.results: List[Dict] = []
-        self.filtered_results: List[Dict] = []
+        self._error_indices: List[int] = []
+        self._base_idx: Sequence[int] = []  # The filtered view before sorting, ascending
+        self._filtered_idx: Sequence[int] = []  # Indices into self.results, in display order
+        self._view_first = 0  # Position in _filtered_idx of the top rendered row
+        self._iid_to_result: Dict[str, Dict] = {}  # Created tree item -> its result
+        self._iid_serial: Dict[str, int] = {}  # Created tree item -> S/N it currently shows
+        self._sort_state: Dict[str, bool] = {}  # Column -> last sort was descending
+        self._pending_error_data: Optional[List[Dict]] = None  # Errors not yet rendered
+        self._history_lines = deque(maxlen=self.HISTORY_MAX_LINES)  # Lines shown in the history pane
+        self._history_dirty = False  # History lines changed since the pane was rendered
+        self._filter_after = None  # Pending debounced filter application
+        self._status_after = None  # Pending reset of the completion status line
         self.parent_folder = ""
         self.excel_file = ""
         
@@ -95,10 +152,37 @@ class ApplicationGUI:
         
         # Processing state
         self.is_processing = False
+        self._pending_progress = None  # Latest (current, total, message) not yet shown
+        self._progress_lock = threading.Lock()  # Guards _pending_progress across threads
+        
+        # Worker-side callbacks are queued and applied by a single Tk-side pump
+        self._ui_queue = queue.Queue()
+        self.root.after(self.UI_POLL_MS, self._drain_ui_queue)
         
         # Load existing history
         self._load_history()
         
+        # Keep one buffered append handle for the session instead of reopening per batch
+        try:
+            self._history_fh = open(self.HISTORY_FILE, 'a', buffering=8192, encoding='utf-8')
+            atexit.register(self._history_fh.close)
+        except OSError as e:
+            logger.warning(f"Could not open history file: {e}")
+            self._history_fh = None
+        
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        
+    def _deferred_setup(self):
+        """Setup that doesn't need to block the first paint."""
+        # Set window icon
+        try:
+            icon_path = Path(resource_path("logo_square.png"))
+            if icon_path.exists():
+                self.icon_photo = tk.PhotoImage(file=str(icon_path))
+                self.root.iconphoto(True, self.icon_photo)
+        except Exception as e:
+            logger.error(f"Could not load icon: {e}")
+    
     def _setup_ui(self):
         """Setup the user interface."""
         # Main container
@@ -151,9 +235,20 @@ class ApplicationGUI:
                 control_frame,
                 text=text,
                 variable=self.filter_var,
-                value=value,
-                command=self._apply_filter
+                value=value
             ).pack(side=tk.LEFT, padx=2)
+        self.filter_var.trace_add('write', self._on_filter_change)
+        
+        # Parallelism controls
+        ttk.Label(control_frame, text="Parallelism:").pack(side=tk.LEFT, padx=(20, 5))
+        self.executor_mode = tk.StringVar(value=self.processor.executor_mode)
+        ttk.Combobox(
+            control_frame,
+            textvariable=self.executor_mode,
+            values=ApplicationProcessor.EXECUTOR_MODES,
+            state='readonly',
+            width=10
+        ).pack(side=tk.LEFT, padx=2)
         
         # === Section 3: Progress Bar ===
         progress_frame = ttk.Frame(main_frame)
@@ -177,23 +272,24 @@ class ApplicationGUI:
         table_frame.rowconfigure(0, weight=1)
         
         # Create treeview with scrollbars for results
-        tree_scroll_y = ttk.Scrollbar(table_frame, orient=tk.VERTICAL)
-        tree_scroll_x = ttk.Scrollbar(table_frame, orient=tk.HORIZONTAL)
+        self.tree_scroll_y = ttk.Scrollbar(table_frame, orient=tk.VERTICAL)
+        self.tree_scroll_x = ttk.Scrollbar(table_frame, orient=tk.HORIZONTAL)
         
-        columns = (
-            'S/N', 'NAME', 'POSITION CODE', 'GENDER', 
-            'INT/EXT', 'DOB', 'AGE', 'NATIONALITY', 'EXP START', 'EXPERIENCE', 'QUALIFICATIONS', 'Status'
-        )
         self.tree = ttk.Treeview(
             table_frame,
-            columns=columns,
+            columns=self._COLUMNS,
             show='headings',
-            yscrollcommand=tree_scroll_y.set,
-            xscrollcommand=tree_scroll_x.set
+            xscrollcommand=self.tree_scroll_x.set
         )
         
-        tree_scroll_y.config(command=self.tree.yview)
-        tree_scroll_x.config(command=self.tree.xview)
+        # The tree only holds the visible window of rows, so the vertical
+        # scrollbar is driven from the filtered results instead of the tree
+        self.tree_scroll_y.config(command=self._on_tree_yview)
+        self.tree_scroll_x.config(command=self.tree.xview)
+        # Estimates until a rendered row can be measured (see _measure_rows)
+        self._row_height = int(ttk.Style().lookup('Treeview', 'rowheight') or 20)
+        self._heading_height = self._row_height
+        self._rows_measured = False
         
         column_widths = {
             'S/N': 40, 'NAME': 180, 'POSITION CODE': 100, 'GENDER': 60,
@@ -201,14 +297,24 @@ class ApplicationGUI:
             'EXP START': 80, 'EXPERIENCE': 80, 'QUALIFICATIONS': 250, 'Status': 100,
         }
         
-        for col in columns:
+        for col in self._COLUMNS:
             self.tree.heading(col, text=col, command=lambda c=col: self._sort_by_column(c))
             self.tree.column(col, width=column_widths.get(col, 100), minwidth=50)
         
         self.tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        tree_scroll_y.grid(row=0, column=1, sticky=(tk.N, tk.S))
-        tree_scroll_x.grid(row=1, column=0, sticky=(tk.W, tk.E))
+        self.tree_scroll_y.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.tree_scroll_x.grid(row=1, column=0, sticky=(tk.W, tk.E))
         self.tree.bind("<Double-1>", self._edit_cell)
+        self.tree.bind("<Configure>", lambda e: self._render_window(self._view_first))
+        self.tree.bind("<MouseWheel>", self._on_tree_wheel)
+        self.tree.bind("<Button-4>", self._on_tree_wheel)
+        self.tree.bind("<Button-5>", self._on_tree_wheel)
+        self.tree.bind("<Up>", self._on_tree_key)
+        self.tree.bind("<Down>", self._on_tree_key)
+        
+        # Row colors by status
+        self.tree.tag_configure('error', background='#ffcccc')
+        self.tree.tag_configure('warning', background='#ffffcc')
 
         # Tab 2: Errors & Warnings
         error_frame = ttk.Frame(self.notebook, padding="10")
@@ -216,8 +322,17 @@ class ApplicationGUI:
         error_frame.columnconfigure(0, weight=1)
         error_frame.rowconfigure(0, weight=1)
         
-        self.error_text = scrolledtext.ScrolledText(error_frame, font=("Consolas", 10), state='disabled', wrap=tk.WORD)
-        self.error_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.error_tree = ttk.Treeview(error_frame, columns=('applicant', 'message'), show='headings')
+        self.error_tree.heading('applicant', text='Applicant', anchor=tk.W)
+        self.error_tree.heading('message', text='Message', anchor=tk.W)
+        self.error_tree.column('applicant', width=200, stretch=False)
+        self.error_tree.column('message', width=600)
+        
+        error_scroll = ttk.Scrollbar(error_frame, orient=tk.VERTICAL, command=self.error_tree.yview)
+        self.error_tree.configure(yscrollcommand=error_scroll.set)
+        
+        self.error_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        error_scroll.grid(row=0, column=1, sticky=(tk.N, tk.S))
 
         # Tab 3: Processing History
         history_frame = ttk.Frame(self.notebook, padding="10")
@@ -228,6 +343,8 @@ class ApplicationGUI:
         self.history_text = scrolledtext.ScrolledText(history_frame, font=("Consolas", 10), state='disabled', wrap=tk.WORD)
         self.history_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_change)
+        
         # === Section 4: Statistics (Removed) ===
         # User requested removal of statistics section.
         # Keeping minimal placeholder if needed or just removing frame completely.
@@ -287,52 +404,98 @@ class ApplicationGUI:
         # Clear previous results
         self._clear_results()
         
+        # Keep a previous batch's status reset from overwriting this batch's progress
+        if self._status_after is not None:
+            self.root.after_cancel(self._status_after)
+            self._status_after = None
+        
         # Disable button
         self.process_btn.config(state='disabled')
         self.is_processing = True
         
-        # Start processing in separate thread
-        thread = threading.Thread(target=self._process_thread, daemon=True)
-        thread.start()
-    
-    def _process_thread(self):
-        """Processing thread."""
-        try:
-            result = self.processor.process_applications(
+        # Threads, processes or auto (processes for larger batches)
+        self.processor.executor_mode = self.executor_mode.get()
+        
+        # Schedule processing on the background event loop
+        future = asyncio.run_coroutine_threadsafe(
+            self.processor.process_applications_async(
                 self.parent_folder,
                 progress_callback=self._update_progress
-            )
-            
-            # Update UI in main thread
-            self.root.after(0, self._processing_complete, result)
-            
+            ),
+            self._loop
+        )
+        future.add_done_callback(self._on_processing_done)
+    
+    def _on_processing_done(self, future):
+        """Hand the batch result back to the main thread."""
+        try:
+            result = future.result()
         except Exception as e:
             logger.error(f"Processing error: {e}")
-            self.root.after(0, self._processing_error, str(e))
+            self._ui_queue.put_nowait((self._processing_error, (str(e),)))
+            return
+        
+        # Update UI in main thread
+        self._ui_queue.put_nowait((self._processing_complete, (result,)))
     
     def _update_progress(self, current: int, total: int, message: str):
-        """Update progress bar and message."""
-        def update():
-            if total > 0:
-                progress = (current / total) * 100
-                self.progress_bar['value'] = progress
-            self.progress_var.set(message)
-        
-        self.root.after(0, update)
+        """
+        Record the latest progress from the worker side.
+        
+        Only the most recent values are kept; the UI pump shows them on its
+        next tick, so fast batches cost one refresh per tick at most.
+        """
+        with self._progress_lock:
+            self._pending_progress = (current, total, message)
+    
+    def _drain_ui_queue(self):
+        """Apply pending progress and queued worker callbacks, then reschedule."""
+        try:
+            # Take and clear in one step so an update landing in between isn't lost
+            with self._progress_lock:
+                pending, self._pending_progress = self._pending_progress, None
+            if pending is not None:
+                current, total, message = pending
+                if total > 0:
+                    progress = (current / total) * 100
+                    self.progress_bar['value'] = progress
+                self.progress_var.set(message)
+            
+            for _ in range(self.UI_POLL_BATCH):
+                try:
+                    fn, args = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                fn(*args)
+        finally:
+            self.root.after(self.UI_POLL_MS, self._drain_ui_queue)
+    
+    def _cancel_progress(self):
+        """Drop any pending progress so it can't overwrite a final status."""
+        with self._progress_lock:
+            self._pending_progress = None
     
     def _processing_complete(self, result: Dict):
         """Handle processing completion."""
+        self._cancel_progress()
         self.is_processing = False
         self.process_btn.config(state='normal')
         
         self.results = result.get('results', [])
-        self.filtered_results = self.results.copy()
+        
+        # Index errored rows once so the "Errors Only" filter doesn't rescan
+        self._error_indices = [
+            i for i, r in enumerate(self.results)
+            if r.get('extraction_status') not in ('success', 'no_form')
+        ]
         
         # Update table
-        self._populate_table(self.results)
+        self._base_idx = self._filtered_idx = range(len(self.results))
+        self._reset_table()
         
-        # Update Errors tab
-        self._update_errors_tab(result.get('errors', []))
+        # Errors and History tabs are only rendered when shown
+        errors = result.get('errors', [])
+        self._pending_error_data = errors
         
         # Update History
         self._add_to_history(result)
@@ -349,18 +512,30 @@ class ApplicationGUI:
         )
         self.stats_text.set(stats_text)
         
-        self.progress_var.set("Processing complete!")
         self.progress_bar['value'] = 100
         
         # Add completion marker to history
-        self.history_text.config(state='normal')
-        self.history_text.insert(1.0, f"[{datetime.now().strftime('%H:%M:%S')}] Batch processing completed successfully.\n\n")
-        self.history_text.config(state='disabled')
+        self._append_history(
+            f"[{datetime.now().strftime('%H:%M:%S')}] Batch processing completed successfully.\n\n"
+        )
+        
+        if errors:
+            # Switch to errors tab if there are errors
+            self.notebook.select(1)
+        self._on_tab_change()
         
-        messagebox.showinfo("Complete", f"Processing complete!\n\n{stats_text}")
+        # Report in the status line rather than a modal dialog, then fade back
+        self.progress_var.set(f"Complete: {stats_text}")
+        self._status_after = self.root.after(self.STATUS_RESET_MS, self._reset_status)
+    
+    def _reset_status(self):
+        """Return the status line to its idle text."""
+        self._status_after = None
+        self.progress_var.set("Ready to process")
     
     def _processing_error(self, error_msg: str):
         """Handle processing error."""
+        self._cancel_progress()
         self.is_processing = False
         self.process_btn.config(state='normal')
         
@@ -369,74 +544,268 @@ class ApplicationGUI:
         
         messagebox.showerror("Processing Error", f"An error occurred:\n\n{error_msg}")
     
-    def _populate_table(self, data: List[Dict]):
-        """Populate the results table."""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Add new items
-        for idx, result in enumerate(data, start=1):
-            fields = result.get('fields', {})
-            status = result.get('extraction_status', 'unknown')
-            
-            values = (
-                idx,  # S/N
-                fields.get('NAME', ''),
-                fields.get('POSITION CODE', ''),
-                fields.get('GENDER', ''),
-                fields.get('INT/EXT', ''),
-                fields.get('DOB', ''),
-                fields.get('AGE', ''),
-                fields.get('NATIONALITY', ''),
-                fields.get('EXP START (YEAR)', ''),
-                fields.get('EXPERIENCE(Years)', ''),
-                fields.get('QUALIFICATIONS', ''),
-                status,
-            )
+    # Extra rows rendered below the viewport so a partially visible row is filled
+    _WINDOW_PADDING = 2
+    
+    def _reset_table(self):
+        """Drop every cached row (new data) and show the current view."""
+        if self._iid_to_result:
+            self.tree.delete(*self._iid_to_result)
+        self._iid_to_result = {}
+        self._iid_serial = {}
+        
+        self._populate_table()
+    
+    def _populate_table(self):
+        """Show the current filtered view from the top, reusing cached rows."""
+        # Rows are detached rather than deleted so a filter or sort change
+        # can reattach them instead of recreating them
+        children = self.tree.get_children()
+        if children:
+            self.tree.detach(*children)
+        
+        self._render_window(0)
+        self.tree_scroll_x.set(*self.tree.xview())
+    
+    def _serial(self, index: int) -> int:
+        """S/N of a result: its position in the filtered view, ignoring any sort."""
+        return bisect_left(self._base_idx, index) + 1
+    
+    def _row_values(self, serial: int, result: Dict) -> tuple:
+        """Table row values for a result."""
+        fields = result.get('fields', {})
+        return (
+            serial,  # S/N
+            fields.get('NAME', ''),
+            fields.get('POSITION CODE', ''),
+            fields.get('GENDER', ''),
+            fields.get('INT/EXT', ''),
+            fields.get('DOB', ''),
+            fields.get('AGE', ''),
+            fields.get('NATIONALITY', ''),
+            fields.get('EXP START (YEAR)', ''),
+            fields.get('EXPERIENCE(Years)', ''),
+            fields.get('QUALIFICATIONS', ''),
+            result.get('extraction_status', 'unknown'),
+        )
+    
+    def _visible_row_count(self) -> int:
+        """Number of rows that fit in the table viewport."""
+        height = self.tree.winfo_height()
+        if height <= 1:
+            # Not mapped yet, fall back to the requested height
+            return int(self.tree.cget('height'))
+        return max(1, (height - self._heading_height) // self._row_height)
+    
+    def _measure_rows(self) -> bool:
+        """
+        Replace the row and heading height estimates with the real ones.
+        
+        The first displayed row's bounding box gives the row height and,
+        through its y offset, the space taken by the headings. Returns True
+        if the measurement changed the number of visible rows.
+        """
+        children = self.tree.get_children('')
+        if not children:
+            return False
+        bbox = self.tree.bbox(children[0])
+        if not bbox:
+            # Not displayed yet, try again on the next render
+            return False
+        
+        before = self._visible_row_count()
+        _, y, _, height = bbox
+        self._row_height = max(1, height)
+        self._heading_height = y
+        self._rows_measured = True
+        return self._visible_row_count() != before
+    
+    def _render_window(self, first: int):
+        """
+        Render only the rows of the filtered view that are on screen.
+        
+        Rows that scrolled out are detached and kept for reuse. Rows coming
+        into view are reattached if they were created before (updating the
+        S/N if the filter changed it) and only inserted otherwise; rows
+        still in view are left untouched.
+        """
+        total = len(self._filtered_idx)
+        visible = self._visible_row_count()
+        first = max(0, min(first, total - visible))
+        last = min(total, first + visible + self._WINDOW_PADDING)
+        self._view_first = first
+        
+        wanted = {str(self._filtered_idx[pos]) for pos in range(first, last)}
+        attached = set()
+        stale = []
+        for iid in self.tree.get_children(''):
+            if iid in wanted:
+                attached.add(iid)
+            else:
+                stale.append(iid)
+        if stale:
+            self.tree.detach(*stale)
+        
+        for row, pos in enumerate(range(first, last)):
+            index = self._filtered_idx[pos]
+            iid = str(index)
+            if iid in attached:
+                continue
             
-            item = self.tree.insert('', tk.END, values=values)
+            serial = self._serial(index)
+            if iid in self._iid_to_result:
+                self.tree.move(iid, '', row)
+                if self._iid_serial[iid] != serial:
+                    self.tree.set(iid, 'S/N', serial)
+                    self._iid_serial[iid] = serial
+                continue
             
-            # Color code based on status
-            if status == 'no_form':
-                self.tree.item(item, tags=('warning',))
-            elif status != 'success':
-                self.tree.item(item, tags=('error',))
+            result = self.results[index]
+            status = result.get('extraction_status', 'unknown')
+            self.tree.insert(
+                '', row, iid=iid,
+                values=self._row_values(serial, result),
+                tags=self._STATUS_TAG.get(status, ('error',))
+            )
+            self._iid_to_result[iid] = result
+            self._iid_serial[iid] = serial
         
-        # Configure tags
-        self.tree.tag_configure('error', background='#ffcccc')
-        self.tree.tag_configure('warning', background='#ffffcc')
+        self.tree.yview_moveto(0)
+        if not self._rows_measured and self._measure_rows():
+            # The estimate was off, render again with the real row count
+            self._render_window(first)
+            return
+        
+        if total:
+            self.tree_scroll_y.set(first / total, min(1.0, (first + visible) / total))
+        else:
+            self.tree_scroll_y.set(0, 1)
+    
+    def _on_tree_yview(self, *args):
+        """Scrollbar command: move the rendered window over the filtered view."""
+        total = len(self._filtered_idx)
+        if not total:
+            return
+        
+        if args[0] == 'moveto':
+            first = int(float(args[1]) * total)
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            if args[2] == 'pages':
+                step *= self._visible_row_count()
+            first = self._view_first + step
+        else:
+            return
+        
+        self._render_window(first)
+    
+    def _on_tree_wheel(self, event):
+        """Scroll the rendered window with the mouse wheel."""
+        if event.num == 4:
+            step = -3
+        elif event.num == 5:
+            step = 3
+        else:
+            step = -3 if event.delta > 0 else 3
+        
+        self._render_window(self._view_first + step)
+        return 'break'
+    
+    def _on_tree_key(self, event):
+        """Scroll the rendered window when the keyboard moves past its edge."""
+        focus = self.tree.focus()
+        children = self.tree.get_children('')
+        if not focus or focus not in children:
+            return
+        
+        step = 1 if event.keysym == 'Down' else -1
+        target = children.index(focus) + step
+        if 0 <= target < min(len(children), self._visible_row_count()):
+            # Still inside the window, let the default binding move the focus
+            return
+        
+        pos = self._view_first + target
+        if not 0 <= pos < len(self._filtered_idx):
+            return 'break'
+        
+        self._render_window(self._view_first + step)
+        iid = str(self._filtered_idx[pos])
+        self.tree.focus(iid)
+        self.tree.selection_set(iid)
+        return 'break'
+    
+    def _on_filter_change(self, *args):
+        """Debounce filter changes so only the settled value is applied."""
+        if self._filter_after is not None:
+            self.root.after_cancel(self._filter_after)
+        self._filter_after = self.root.after(self.FILTER_DEBOUNCE_MS, self._apply_filter)
     
     def _apply_filter(self):
         """Apply filter to results."""
+        self._filter_after = None
         filter_type = self.filter_var.get()
         
+        # The view is a sequence of indices into self.results; neither case
+        # copies the results (sorting builds a new list rather than mutating)
         if filter_type == "all":
-            self.filtered_results = self.results.copy()
+            self._base_idx = range(len(self.results))
         elif filter_type == "errors":
-            # Show errors and missing forms
-            self.filtered_results = [
-                r for r in self.results
-                if r.get('extraction_status') not in ['success', 'no_form']
-            ]
+            # Show errors (indices built once in _processing_complete)
+            self._base_idx = self._error_indices
+        self._filtered_idx = self._base_idx
         
-        self._populate_table(self.filtered_results)
+        self._populate_table()
     
 
     def _sort_by_column(self, col: str):
-        """Sort table by column."""
-        # Get column index
-        col_index = self.tree['columns'].index(col)
-        
-        # Get all items
-        items = [(self.tree.set(item, col), item) for item in self.tree.get_children('')]
-        
-        # Sort items
-        items.sort(reverse=False)
-        
-        # Rearrange items
-        for index, (val, item) in enumerate(items):
-            self.tree.move(item, '', index)
+        """Sort table by column, toggling ascending/descending on repeated clicks."""
+        descending = not self._sort_state.get(col, True)
+        self._sort_state[col] = descending
+        
+        # Read values from the results rather than round-tripping through Tk
+        if col == 'S/N':
+            get_value = lambda index, result: self._serial(index)
+        elif col == 'Status':
+            get_value = lambda index, result: result.get('extraction_status', 'unknown')
+        else:
+            field_key = self._COLUMN_TO_FIELD[col]
+            get_value = lambda index, result: result.get('fields', {}).get(field_key, '')
+        
+        key_fn = self._sort_key(col)
+        keyed = [
+            (key_fn(get_value(index, self.results[index])), index)
+            for index in self._filtered_idx
+        ]
+        keyed.sort(key=lambda kv: kv[0], reverse=descending)
+        self._filtered_idx = [index for _, index in keyed]
+        
+        self._populate_table()
+    
+    def _sort_key(self, col: str) -> Callable:
+        """
+        Key function for sorting a column's values.
+        
+        Numbers and dates compare by value; anything that doesn't parse
+        (e.g. empty cells) sorts after the parsed values as text.
+        """
+        if col in self._NUMERIC_COLUMNS:
+            def key(value):
+                try:
+                    return (0, float(value))
+                except (TypeError, ValueError):
+                    return (1, str(value).lower())
+        elif col == 'DOB':
+            def key(value):
+                for fmt in self._DOB_FORMATS:
+                    try:
+                        return (0, datetime.strptime(str(value), fmt))
+                    except ValueError:
+                        pass
+                return (1, str(value).lower())
+        else:
+            def key(value):
+                return (0, str(value).lower())
+        return key
 
     def _edit_cell(self, event):
         """Edit cell on double-click."""
@@ -449,8 +818,7 @@ class ApplicationGUI:
         column_index = int(column.replace('#', '')) - 1
         
         # Don't allow editing S/N or Status columns
-        # indices: 0=S/N, 11=Status
-        if column_index in [0, 11]:
+        if column_index in self._NON_EDITABLE:
             return
         
         # Get current value
@@ -470,42 +838,9 @@ class ApplicationGUI:
             values[column_index] = new_value
             self.tree.item(item, values=values)
             
-            # Update results data
-            # values[1] is the NAME. 
-            # If changed, we might lose the link if we use NAME as key.
-            # However, for now let's assume names are unique enough or 
-            # use the original values from the tree before edit.
-            
-            # Get the original values before the update in results
-            # For simplicity, we'll continue using values[1] (NAME) to find the result
-            # but we should be aware this is still slightly fragile.
-            name_val = values[1] 
-            for result in self.results:
-                # If we are editing NAME itself, we should have found it by the OLD name.
-                # But here values[1] is already the NEW name.
-                pass
-                
-            # Improved sync: find by index if possible, or just the first match
-            # Let's use a simpler approach: update the result in self.results 
-            # that corresponds to this tree item.
-            
-            # treeview item IDs are persistent for the life of the item.
-            # We'll stick to a simpler name-based lookup for now but fix the logic.
-            # Actually, the user's name is in fields['NAME'].
-            
-            tree_col_name = self.tree['columns'][column_index]
-            mapping = {
-                'EXP START': 'EXP START (YEAR)',
-                'EXPERIENCE': 'EXPERIENCE(Years)',
-            }
-            field_key = mapping.get(tree_col_name, tree_col_name)
-            
-            # Find the result that matches the OTHER fields to be sure
-            # Or just use the one where we saved the name before.
-            for result in self.results:
-                if result['fields'].get('NAME') == current_value:
-                    result['fields'][field_key] = new_value
-                    break
+            # Update the result behind this row
+            field_key = self._COLUMN_TO_FIELD[self._COLUMNS[column_index]]
+            self._iid_to_result[item]['fields'][field_key] = new_value
             
             entry.destroy()
         
@@ -523,7 +858,28 @@ class ApplicationGUI:
             return
         
         try:
-            export_result = self.excel_exporter.append_to_excel(self.excel_file, self.results)
+            excel_path = Path(self.excel_file)
+            
+            # Large workbooks can be streamed to keep memory flat, but that
+            # drops all formatting, so only with the user's consent
+            streaming = False
+            if excel_path.exists() and excel_path.stat().st_size > config.EXCEL_STREAMING_THRESHOLD:
+                streaming = messagebox.askyesnocancel(
+                    "Large Workbook",
+                    f"{excel_path.name} is {excel_path.stat().st_size / (1024 * 1024):.1f} MB.\n\n"
+                    "Use fast export? It uses much less memory but keeps only cell values: "
+                    "formatting, column widths, merged cells, conditional formats, "
+                    "freeze panes and filters will be lost.\n\n"
+                    "Yes: fast export (loses formatting)\n"
+                    "No: standard export (keeps formatting, slower)"
+                )
+                if streaming is None:
+                    return
+            
+            if streaming:
+                export_result = self.excel_exporter.write_only_append(self.excel_file, self.results)
+            else:
+                export_result = self.excel_exporter.append_to_excel(self.excel_file, self.results)
             
             messagebox.showinfo(
                 "Export Complete",
@@ -536,28 +892,19 @@ class ApplicationGUI:
             messagebox.showerror("Export Error", f"Failed to export:\n\n{str(e)}")
     
     def _update_errors_tab(self, errors: List[Dict]):
-        """Update the errors tab with current batch errors."""
-        self.error_text.config(state='normal')
-        self.error_text.delete(1.0, tk.END)
+        """Update the errors tab with current batch errors, one row per message."""
+        self.error_tree.delete(*self.error_tree.get_children())
         
         if not errors:
-            self.error_text.insert(tk.END, "No extraction errors or warnings in this batch.\n")
-        else:
-            self.error_text.insert(tk.END, f"Found {len(errors)} issues in this batch:\n\n")
-            for idx, err in enumerate(errors, start=1):
-                self.error_text.insert(tk.END, f"{idx}. {err['applicant']}\n")
-                msgs = err.get('error', [])
-                if isinstance(msgs, list):
-                    for m in msgs:
-                        self.error_text.insert(tk.END, f"   - {m}\n")
-                else:
-                    self.error_text.insert(tk.END, f"   - {msgs}\n")
-                self.error_text.insert(tk.END, "\n")
-        
-        self.error_text.config(state='disabled')
-        if errors:
-            # Switch to errors tab if there are errors
-            self.notebook.select(1)
+            self.error_tree.insert('', tk.END, values=('', "No extraction errors or warnings in this batch."))
+            return
+        
+        for err in errors:
+            msgs = err.get('error', [])
+            if not isinstance(msgs, list):
+                msgs = [msgs]
+            for msg in msgs:
+                self.error_tree.insert('', tk.END, values=(err['applicant'], msg))
 
     def _add_to_history(self, result: Dict):
         """Append processing result to history log."""
@@ -580,26 +927,52 @@ class ApplicationGUI:
         
         history_entry += f"{'-'*50}\n"
         
-        self.history_text.config(state='normal')
-        self.history_text.insert(1.0, history_entry) # Insert at top
-        self.history_text.config(state='disabled')
+        self._append_history(history_entry)
         
         # Persist history to file
-        try:
-            with open("processing_history.txt", "a", encoding='utf-8') as f:
-                f.write(history_entry)
-        except:
-            pass
+        if self._history_fh:
+            try:
+                self._history_fh.write(history_entry)
+                self._history_fh.flush()
+            except OSError:
+                pass
+
+    def _on_tab_change(self, event=None):
+        """Render the Errors or History tab from pending data when it is shown."""
+        current = self.notebook.index('current')
+        
+        if current == 1 and self._pending_error_data is not None:
+            self._update_errors_tab(self._pending_error_data)
+            self._pending_error_data = None
+        elif current == 2 and self._history_dirty:
+            self._render_history()
+
+    def _append_history(self, text: str):
+        """Add text to the capped history buffer; the pane is redrawn when next shown."""
+        self._history_lines.extend(text.splitlines(keepends=True))
+        self._history_dirty = True
+
+    def _render_history(self):
+        """Redraw the history pane from the capped line buffer."""
+        self.history_text.config(state='normal')
+        self.history_text.delete(1.0, tk.END)
+        self.history_text.insert(tk.END, ''.join(self._history_lines))
+        self.history_text.config(state='disabled')
+        self.history_text.see(tk.END)
+        self._history_dirty = False
 
     def _load_history(self):
-        """Load history from file if it exists."""
-        if Path("processing_history.txt").exists():
+        """Load the tail of the history file if it exists."""
+        history_path = Path(self.HISTORY_FILE)
+        if history_path.exists():
             try:
-                with open("processing_history.txt", "r", encoding='utf-8') as f:
-                    content = f.read()
-                    self.history_text.config(state='normal')
-                    self.history_text.insert(tk.END, content)
-                    self.history_text.config(state='disabled')
+                with open(history_path, 'rb') as f:
+                    if history_path.stat().st_size > self.HISTORY_TAIL_BYTES:
+                        f.seek(-self.HISTORY_TAIL_BYTES, os.SEEK_END)
+                        f.readline()  # Discard the partial first line
+                    content = f.read().decode('utf-8', errors='replace')
+                self._append_history(content)
+                self._render_history()
             except:
                 pass
 
@@ -610,15 +983,23 @@ class ApplicationGUI:
     def _clear_results(self):
         """Clear all results."""
         self.results = []
-        self.filtered_results = []
+        self._error_indices = []
+        self._base_idx = self._filtered_idx = []
         
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self._reset_table()
         
         self.stats_text.set("")
         self.progress_var.set("Ready to process")
         self.progress_bar['value'] = 0
     
+    def _on_close(self):
+        """Release the history file and event loop, then close the window."""
+        if self._history_fh:
+            self._history_fh.close()
+            self._history_fh = None
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self.root.destroy()
+    
     def run(self):
         """Run the application."""
         self.root.mainloop()
@@ -633,4 +1014,6 @@ def main():
 
 
 if __name__ == '__main__':
+    # Required for process pools in the frozen executable
+    multiprocessing.freeze_support()
     main()
@@ -2,67 +2,391 @@
 Main processing engine with progress tracking and error handling.
 """
 
+import asyncio
 import logging
+import os
+import random
+import shutil
+import threading
 import time
-from typing import List, Dict, Callable, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict, deque
+from typing import List, Dict, Callable, Optional, Tuple
+from concurrent.futures import (
+    Executor, Future, ProcessPoolExecutor, as_completed
+)
 from datetime import datetime
 
-from scanner import FolderScanner
+from scanner import Applicant, FolderScanner
 from extractor import FieldExtractor
 
 from pathlib import Path
 import json
 import hashlib
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _dump_cache_line(key: str, value: Dict) -> bytes:
+    """Serialize one cache log record, using orjson when it is installed."""
+    if orjson:
+        return orjson.dumps({key: value}) + b"\n"
+    return (json.dumps({key: value}) + "\n").encode('utf-8')
+
+
+def _load_cache_line(line: bytes) -> Dict:
+    """Parse one cache log record (raises ValueError on a malformed line)."""
+    if orjson:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def _process_single_application(applicant: Applicant, extractor: FieldExtractor) -> Dict:
+    """
+    Process a single application.
+    
+    Module level so it can be sent to a process pool.
+    
+    Args:
+        applicant: Applicant folder info from the scanner
+        extractor: Field extractor to use
+    
+    Returns:
+        Dictionary with extraction results
+    """
+    name = applicant.applicant_name
+    logger.info("Processing applicant: %s", name)
+    
+    # Check if form exists
+    if not applicant.application_form:
+        msg = "Application form not found in folder. Manually extract information from CV if available."
+        fields = extractor.default_fields.copy()
+        fields['NAME'] = name
+        return {
+            'applicant_name': name,
+            'folder_path': applicant.folder_path,
+            'extraction_status': 'no_form',
+            'error_message': msg,
+            'fields': fields,
+            'errors': [msg],
+        }
+    
+    try:
+        # Extract data from form
+        extraction = extractor.extract_from_file(applicant.application_form)
+    except Exception as e:
+        logger.error("Error extracting from %s: %s", applicant.application_form, e)
+        fields = extractor.default_fields.copy()
+        fields['NAME'] = name
+        return {
+            'applicant_name': name,
+            'folder_path': applicant.folder_path,
+            'extraction_status': 'error',
+            'error_message': None,
+            'fields': fields,
+            'errors': [str(e)],
+        }
+    
+    # ALWAYS inherit name from folder as per user request
+    fields = extraction['fields']
+    fields['NAME'] = name.upper()
+    
+    return {
+        'applicant_name': name,
+        'folder_path': applicant.folder_path,
+        'extraction_status': extraction['extraction_status'],
+        'error_message': extraction['error_message'],
+        'fields': fields,
+        'errors': extraction.get('errors', []),
+        'file_name': extraction['file_name'],
+    }
+
+
+class LRUCache(OrderedDict):
+    """
+    Dict capped at `capacity` entries, evicting the least recently used.
+    
+    Reads through [] or get() and writes both count as use. A capacity of
+    None leaves the dict unbounded.
+    """
+    
+    def __init__(self, capacity: Optional[int] = None):
+        super().__init__()
+        self.capacity = capacity
+    
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+    
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        self._evict()
+    
+    def set_capacity(self, capacity: Optional[int]):
+        """Change the capacity, evicting entries if it shrank."""
+        self.capacity = capacity
+        self._evict()
+    
+    def _evict(self):
+        if self.capacity is None:
+            return
+        while len(self) > self.capacity:
+            self.popitem(last=False)
+
+
+class WorkStealingPool(Executor):
+    """
+    Thread pool where each worker owns a deque of tasks.
+    
+    submit() deals tasks round-robin onto the worker deques. A worker takes
+    from the front of its own deque and, once that is empty, steals from the
+    back of a randomly chosen victim, so a worker stuck on a large PDF doesn't
+    hold up tasks queued behind it and there is no single shared queue lock.
+    """
+    
+    def __init__(self, max_workers: int = 4):
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+        
+        self._deques = [deque() for _ in range(max_workers)]
+        self._steal_locks = [threading.Lock() for _ in range(max_workers)]
+        self._available = threading.Semaphore(0)  # One permit per queued task
+        self._next_worker = 0
+        self._submit_lock = threading.Lock()
+        self._shutdown = False
+        
+        self._threads = [
+            threading.Thread(target=self._worker, args=(i,), daemon=True)
+            for i in range(max_workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+    
+    def submit(self, fn, *args, **kwargs) -> Future:
+        future = Future()
+        with self._submit_lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            index = self._next_worker
+            self._next_worker = (index + 1) % len(self._deques)
+            self._deques[index].append((future, fn, args, kwargs))
+        self._available.release()
+        return future
+    
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        with self._submit_lock:
+            self._shutdown = True
+        
+        if cancel_futures:
+            for index in range(len(self._deques)):
+                while True:
+                    task = self._take(index)
+                    if task is None:
+                        break
+                    task[0].cancel()
+        
+        # Wake every worker so it can notice the shutdown once its work is gone
+        for _ in self._threads:
+            self._available.release()
+        
+        if wait:
+            for thread in self._threads:
+                thread.join()
+    
+    def _take(self, index: int):
+        """Pop the next task from a worker's own deque, or None when empty."""
+        try:
+            return self._deques[index].popleft()
+        except IndexError:
+            return None
+    
+    def _steal(self, thief: int):
+        """Steal a task from the back of another worker's deque, or None."""
+        count = len(self._deques)
+        start = random.randrange(count)
+        for offset in range(count):
+            victim = (start + offset) % count
+            if victim == thief:
+                continue
+            with self._steal_locks[victim]:
+                try:
+                    return self._deques[victim].pop()
+                except IndexError:
+                    continue
+        return None
+    
+    def _worker(self, index: int):
+        while True:
+            self._available.acquire()
+            
+            task = self._take(index) or self._steal(index)
+            while task is None:
+                # Permits only outnumber tasks once shutdown has been requested
+                if self._shutdown and not any(self._deques):
+                    return
+                task = self._take(index) or self._steal(index)
+            
+            future, fn, args, kwargs = task
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+
 class ApplicationProcessor:
     """Main processor for batch application extraction."""
     
-    def __init__(self, max_workers: int = 4):
+    EXECUTOR_MODES = ('auto', 'threads', 'processes')
+    AUTO_PROCESS_THRESHOLD = 20  # 'auto' switches to processes above this many applicants
+    PROGRESS_INTERVAL = 0.05  # Minimum seconds between progress callbacks
+    ETA_SMOOTHING = 0.1  # Weight of the newest completion gap in the ETA average
+    ERROR_BUFFER_SIZE = 200  # Errors kept in memory while streaming them to a log
+    CACHE_CAPACITY = 10_000  # Minimum cached results held in memory (raised to the batch size)
+    
+    _ERROR_LOG_TITLE = "ECOWAS Application Processor - Error Log\n" + "=" * 60 + "\n"
+    
+    def __init__(self, max_workers: int = 4, executor_mode: str = 'auto'):
+        if executor_mode not in self.EXECUTOR_MODES:
+            raise ValueError(f"Unknown executor mode: {executor_mode}")
+        
         self.scanner = FolderScanner()
         self.extractor = FieldExtractor()
         self.max_workers = max_workers
+        self.executor_mode = executor_mode
         
         self.total_processed = 0
         self.successful = 0
         self.failed = 0
         self.errors = []
-        self.cache = {}
+        self.error_count = 0
+        self.cache = LRUCache()
         self.cache_file = None
+        self._cache_fh = None
+        self._cache_records = 0  # Lines in the cache log, including superseded ones
+        
+        # Per-batch state
+        self._start_time = 0.0
+        self._total_applicants = 0
+        self._progress_callback = None
+        self._last_progress = 0.0
+        self._reported = 0  # Completed count in the last progress callback
+        self._last_completion = 0.0
+        self._ema_task_s = 0.0  # Smoothed seconds between completions
+        self._error_fh = None
+        self._error_log_path = None
 
     def _load_cache(self, parent_folder: str):
-        """Load cache for the parent folder."""
+        """
+        Load cache for the parent folder.
+        
+        The cache is an append-only log with one {folder_path: result} JSON
+        object per line; replaying it in order leaves the latest result for
+        each folder. The replay is unbounded; _fit_cache caps it once the
+        batch's applicants are known.
+        """
         # Create a unique cache file based on parent folder hash to avoid collisions
-        folder_hash = hashlib.md5(parent_folder.encode()).hexdigest()
-        self.cache_file = Path(parent_folder) / f".processing_cache_{folder_hash}.json"
+        folder_hash = hashlib.blake2b(parent_folder.encode(), digest_size=8).hexdigest()
+        self.cache_file = Path(parent_folder) / f".processing_cache_{folder_hash}.ndjson"
+        self.cache = LRUCache()
+        self._cache_records = 0
         
         if self.cache_file.exists():
             try:
-                with open(self.cache_file, 'r') as f:
-                    self.cache = json.load(f)
+                with open(self.cache_file, 'rb') as f:
+                    for line in f:
+                        try:
+                            self.cache.update(_load_cache_line(line))
+                        except ValueError:
+                            continue  # Partial line left by an interrupted write
+                        self._cache_records += 1
                 logger.info(f"Loaded cache with {len(self.cache)} entries")
             except Exception as e:
                 logger.warning(f"Failed to load cache: {e}")
-                self.cache = {}
-        else:
-            self.cache = {}
+                self.cache = LRUCache()
+                self._cache_records = 0
+        
+        self._close_cache_log()
+        try:
+            fh = open(self.cache_file, 'a+b')
+            # An interrupted write can leave a partial last line; end it so the
+            # next record doesn't get glued onto it and lost with it
+            if fh.seek(0, os.SEEK_END):
+                fh.seek(-1, os.SEEK_END)
+                if fh.read(1) != b'\n':
+                    fh.write(b'\n')
+            self._cache_fh = fh
+        except OSError as e:
+            logger.warning(f"Failed to open cache log: {e}")
 
-    def _save_cache(self):
-        """Save current cache to disk."""
-        if self.cache_file:
+    def _fit_cache(self, applicants: List[Applicant]):
+        """
+        Cap the loaded cache for this batch without losing any of its applicants.
+        
+        The batch's entries are marked most recent and the capacity is at least
+        the batch size, so anything evicted now or by later writes belongs to
+        folders no longer in the parent folder.
+        """
+        for applicant in applicants:
+            if applicant.folder_path in self.cache:
+                self.cache.move_to_end(applicant.folder_path)
+        self.cache.set_capacity(max(self.CACHE_CAPACITY, len(applicants)))
+
+    def _append_cache(self, key: str, value: Dict):
+        """Store a result in the cache and append it to the cache log."""
+        self.cache[key] = value
+        if self._cache_fh:
             try:
-                with open(self.cache_file, 'w') as f:
-                    json.dump(self.cache, f)
+                self._cache_fh.write(_dump_cache_line(key, value))
+                self._cache_records += 1
+                if self._cache_records % 10 == 0:
+                    self._cache_fh.flush()
             except Exception as e:
-                logger.warning(f"Failed to save cache: {e}")
+                logger.warning(f"Failed to append to cache: {e}")
+
+    def _close_cache_log(self):
+        """Close the cache log handle if it is open."""
+        if self._cache_fh:
+            try:
+                self._cache_fh.close()
+            except OSError:
+                pass
+            self._cache_fh = None
+
+    def _compact_cache(self):
+        """Rewrite the cache log with only live entries once it is mostly superseded lines."""
+        # Only entries for folders that have left the parent folder are ever evicted,
+        # so rebuilding the log from memory drops nothing still needed
+        if not self.cache_file or self._cache_records <= 2 * len(self.cache):
+            return
+        
+        tmp_file = self.cache_file.with_suffix('.tmp')
+        try:
+            with open(tmp_file, 'wb') as f:
+                for key, value in self.cache.items():
+                    f.write(_dump_cache_line(key, value))
+            os.replace(tmp_file, self.cache_file)
+            self._cache_records = len(self.cache)
+        except Exception as e:
+            logger.warning(f"Failed to compact cache: {e}")
         
     def process_applications(
         self,
         parent_folder: str,
         progress_callback: Optional[Callable] = None,
+        error_log_path: Optional[str] = None,
     ) -> Dict:
         """
         Process all applications in parent folder.
@@ -71,18 +395,130 @@ class ApplicationProcessor:
             parent_folder: Path to folder containing applicant subfolders
             progress_callback: Function to call with progress updates
                               Signature: callback(current, total, message)
+            error_log_path: If given, errors are written to this file as they
+                            occur and only the latest ERROR_BUFFER_SIZE are
+                            kept in memory
         
         Returns:
             Dictionary with processing results
         """
+        applicants = self._begin_batch(parent_folder, progress_callback, error_log_path)
+        if not applicants:
+            return self._empty_batch_result()
+        
+        # Process applications; each result goes in its applicant's scan-order slot
+        results: List[Optional[Dict]] = [None] * len(applicants)
+        pending = self._take_cached(applicants, results)
+        
+        if pending:
+            # Use a thread or process pool for parallel processing
+            with self._make_executor(len(pending)) as executor:
+                # Submit all tasks
+                future_to_applicant = {
+                    executor.submit(_process_single_application, applicant, self.extractor): (slot, applicant)
+                    for slot, applicant in pending
+                }
+                
+                # Process completed tasks
+                for future in as_completed(future_to_applicant):
+                    slot, applicant = future_to_applicant[future]
+                    
+                    try:
+                        self._record_result(applicant, future.result(), results, slot)
+                    except Exception as e:
+                        self._record_failure(applicant, e)
+        
+        return self._finish_batch(results)
+    
+    async def process_applications_async(
+        self,
+        parent_folder: str,
+        progress_callback: Optional[Callable] = None,
+        executor: Optional[Executor] = None,
+        error_log_path: Optional[str] = None,
+    ) -> Dict:
+        """
+        Process all applications in parent folder on the running event loop.
+        
+        Each applicant is submitted to the executor and awaited through
+        asyncio.wrap_future, so disk reads and parsing of different applicants
+        overlap; results are recorded as they complete, exactly like
+        process_applications.
+        
+        Args:
+            parent_folder: Path to folder containing applicant subfolders
+            progress_callback: Function to call with progress updates
+                              Signature: callback(current, total, message)
+            executor: Executor to run applicants on (defaults to a pool
+                      chosen by executor_mode)
+            error_log_path: If given, errors are streamed to this file as in
+                            process_applications
+        
+        Returns:
+            Dictionary with processing results
+        """
+        loop = asyncio.get_running_loop()
+        
+        # Scanning hits the disk too, keep it off the loop
+        applicants = await loop.run_in_executor(
+            None, self._begin_batch, parent_folder, progress_callback, error_log_path
+        )
+        if not applicants:
+            return self._empty_batch_result()
+        
+        results: List[Optional[Dict]] = [None] * len(applicants)
+        pending = self._take_cached(applicants, results)
+        if not pending:
+            return self._finish_batch(results)
+        
+        own_executor = executor is None
+        if own_executor:
+            executor = self._make_executor(len(pending))
+        
+        try:
+            async def run_one(slot: int, applicant: Applicant):
+                try:
+                    result = await asyncio.wrap_future(
+                        executor.submit(_process_single_application, applicant, self.extractor)
+                    )
+                    return slot, applicant, result, None
+                except Exception as e:
+                    return slot, applicant, None, e
+            
+            for next_done in asyncio.as_completed([run_one(slot, a) for slot, a in pending]):
+                slot, applicant, result, error = await next_done
+                
+                try:
+                    if error is not None:
+                        raise error
+                    self._record_result(applicant, result, results, slot)
+                except Exception as e:
+                    self._record_failure(applicant, e)
+            
+            return self._finish_batch(results)
+        finally:
+            if own_executor:
+                executor.shutdown(wait=False)
+    
+    def _begin_batch(
+        self,
+        parent_folder: str,
+        progress_callback: Optional[Callable],
+        error_log_path: Optional[str] = None,
+    ) -> List[Applicant]:
+        """Reset counters, load the cache and scan applicant folders."""
         logger.info(f"Starting batch processing: {parent_folder}")
-        start_time = time.time()
+        self._start_time = time.monotonic()
+        self._progress_callback = progress_callback
+        self._last_progress = 0.0
+        self._reported = 0
         
         # Reset counters
         self.total_processed = 0
         self.successful = 0
         self.failed = 0
-        self.errors = []
+        self.error_count = 0
+        self._open_error_log(error_log_path)
         
         # Scan folders
         if progress_callback:
@@ -92,94 +528,130 @@ class ApplicationProcessor:
         self._load_cache(parent_folder)
         
         applicants = self.scanner.scan_folders(parent_folder)
-        total_applicants = len(applicants)
-        
-        if total_applicants == 0:
-            return {
-                'status': 'error',
-                'message': 'No applicant folders found',
-                'results': [],
-                'stats': self._get_stats(0),
-            }
-        
-        logger.info(f"Found {total_applicants} applicant folders")
-        
-        # Process applications
-        results = []
-        
-        # Use thread pool for parallel processing
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            future_to_applicant = {
-                executor.submit(self._process_single_application, applicant): applicant
-                for applicant in applicants
-            }
+        self._total_applicants = len(applicants)
+        self._fit_cache(applicants)
+        self._last_completion = time.monotonic()
+        self._ema_task_s = 0.0
+        
+        if applicants:
+            logger.info(f"Found {self._total_applicants} applicant folders")
+        
+        return applicants
+    
+    def _empty_batch_result(self) -> Dict:
+        """Result returned when the parent folder has no applicant folders."""
+        self._close_cache_log()
+        self._close_error_log()
+        return {
+            'status': 'error',
+            'message': 'No applicant folders found',
+            'results': [],
+            'stats': self._get_stats(0),
+        }
+    
+    def _record_result(
+        self,
+        applicant: Applicant,
+        result: Dict,
+        results: List[Optional[Dict]],
+        slot: int,
+        notify: bool = True,
+    ):
+        """Store a finished applicant's result in its slot and update counters, errors, cache and progress."""
+        total_applicants = self._total_applicants
+        results[slot] = result
+        
+        self.total_processed += 1
+        if notify:
+            logger.info("Finished %d/%d: %s", self.total_processed, total_applicants, applicant.applicant_name)
+        
+        # Count as success only if no major errors
+        if result['extraction_status'] != 'error':
+            self.successful += 1
+        else:
+            self.failed += 1
+        
+        # Log ANY errors (missing form, failed fields)
+        if result.get('errors') or result.get('error_message'):
+            err_list = result.get('errors', [])
+            if result.get('error_message') and result.get('error_message') not in err_list:
+                err_list.insert(0, result['error_message'])
             
-            # Process completed tasks
-            for future in as_completed(future_to_applicant):
-                applicant = future_to_applicant[future]
-                
-                try:
-                    result = future.result()
-                    results.append(result)
-                    
-                    self.total_processed += 1
-                    logger.info(f"Finished {self.total_processed}/{total_applicants}: {applicant['applicant_name']}")
-                    
-                    # Count as success only if no major errors
-                    if result['extraction_status'] != 'error':
-                        self.successful += 1
-                    else:
-                        self.failed += 1
-                    
-                    # Log ANY errors (missing form, failed fields)
-                    if result.get('errors') or result.get('error_message'):
-                        err_list = result.get('errors', [])
-                        if result.get('error_message') and result.get('error_message') not in err_list:
-                            err_list.insert(0, result['error_message'])
-                        
-                        if err_list:
-                            self.errors.append({
-                                'applicant': applicant['applicant_name'],
-                                'error': err_list
-                            })
-                    
-                    # Update cache if processed successfully
-                    if result['extraction_status'] in ['success', 'no_form']:
-                        self.cache[applicant['folder_path']] = result
-                        if self.total_processed % 10 == 0:
-                            self._save_cache()
-                    
-                    # Progress update
-                    if progress_callback:
-                        elapsed = time.time() - start_time
-                        rate = self.total_processed / elapsed if elapsed > 0 else 0
-                        remaining = (total_applicants - self.total_processed) / rate if rate > 0 else 0
-                        
-                        message = (
-                            f"Processing {applicant['applicant_name']} "
-                            f"({self.total_processed}/{total_applicants}) - "
-                            f"~{int(remaining)}s remaining"
-                        )
-                        progress_callback(self.total_processed, total_applicants, message)
-                
-                except Exception as e:
-                    logger.error(f"Error processing {applicant['applicant_name']}: {e}")
-                    self.failed += 1
-                    self.errors.append({
-                        'applicant': applicant['applicant_name'],
-                        'error': str(e),
-                    })
-        
-        elapsed_time = time.time() - start_time
+            if err_list:
+                self._add_error({
+                    'applicant': applicant.applicant_name,
+                    'error': err_list
+                })
+        
+        # Update cache if processed successfully (cache hits are already logged)
+        if result['extraction_status'] in ['success', 'no_form']:
+            if self.cache.get(applicant.folder_path) is not result:
+                self._append_cache(applicant.folder_path, result)
+        
+        if not notify:
+            return
+        
+        # Smoothed gap between completions; the first gap seeds the average
+        now = time.monotonic()
+        gap = now - self._last_completion
+        self._last_completion = now
+        if self._ema_task_s:
+            self._ema_task_s += self.ETA_SMOOTHING * (gap - self._ema_task_s)
+        else:
+            self._ema_task_s = gap
+        
+        # Progress update, at most once per PROGRESS_INTERVAL but always for the last applicant
+        if self._progress_callback:
+            if (self.total_processed < total_applicants
+                    and now - self._last_progress < self.PROGRESS_INTERVAL):
+                return
+            self._last_progress = now
+            self._reported = self.total_processed
+            
+            remaining = (total_applicants - self.total_processed) * self._ema_task_s
+            
+            message = (
+                f"Processing {applicant.applicant_name} "
+                f"({self.total_processed}/{total_applicants}) - "
+                f"~{int(remaining)}s remaining"
+            )
+            self._progress_callback(self.total_processed, total_applicants, message)
+    
+    def _record_failure(self, applicant: Applicant, error: Exception):
+        """Record an applicant whose processing raised."""
+        logger.error("Error processing %s: %s", applicant.applicant_name, error)
+        self.failed += 1
+        self._add_error({
+            'applicant': applicant.applicant_name,
+            'error': str(error),
+        })
+    
+    def _finish_batch(self, results: List[Optional[Dict]]) -> Dict:
+        """Collect results, persist the cache and build the batch result."""
+        elapsed_time = time.monotonic() - self._start_time
         logger.info(f"Batch processing complete in {elapsed_time:.1f}s")
         
-        # Sort final results and errors alphabetically by applicant name
-        results.sort(key=lambda x: x['applicant_name'].lower())
-        self.errors.sort(key=lambda x: x['applicant'].lower())
+        # Slots follow the scan, which is already alphabetical by applicant name;
+        # only the empty slots of failed applicants need dropping
+        results = [r for r in results if r is not None]
+        
+        # The last completions may have been throttled, and applicants that
+        # raised never reach total_processed, so report the end explicitly
+        total_applicants = self._total_applicants
+        if self._progress_callback and self._reported < total_applicants:
+            self._reported = total_applicants
+            self._progress_callback(
+                total_applicants, total_applicants,
+                f"Finished {self.total_processed}/{total_applicants} - {self.failed} failed"
+            )
+        
+        # Sort errors alphabetically by applicant name
+        self.errors = sorted(self.errors, key=lambda x: x['applicant'].lower())
         
-        # Final cache save
-        self._save_cache()
+        # Close the cache log and compact it if it has grown
+        self._close_cache_log()
+        self._compact_cache()
+        self._close_error_log()
         
         return {
             'status': 'complete',
@@ -188,77 +660,58 @@ class ApplicationProcessor:
             'errors': self.errors,
         }
     
-    def _process_single_application(self, applicant: Dict) -> Dict:
+    def _cached_result(self, applicant: Applicant) -> Optional[Dict]:
+        """Return the cached result for an applicant, if any."""
+        res = self.cache.get(applicant.folder_path)
+        if res is not None and 'fields' in res:
+            # Force name inheritance from current folder name, even for cached results
+            res['fields']['NAME'] = applicant.applicant_name.upper()
+        return res
+    
+    def _take_cached(
+        self, applicants: List[Applicant], results: List[Optional[Dict]]
+    ) -> List[Tuple[int, Applicant]]:
         """
-        Process a single application.
+        Record cached applicants straight into results and return the rest
+        as (slot, applicant) pairs.
         
-        Args:
-            applicant: Dictionary with applicant folder info
+        Cache hits never reach the executor and report progress once for
+        the whole group rather than per applicant.
+        """
+        pending = []
+        for slot, applicant in enumerate(applicants):
+            cached = self._cached_result(applicant)
+            if cached is None:
+                pending.append((slot, applicant))
+            else:
+                self._record_result(applicant, cached, results, slot, notify=False)
         
-        Returns:
-            Dictionary with extraction results
+        hits = len(applicants) - len(pending)
+        if hits:
+            logger.info(f"Reused {hits} cached results")
+            if self._progress_callback:
+                self._reported = self.total_processed
+                self._progress_callback(
+                    self.total_processed, self._total_applicants,
+                    f"Loaded {hits} cached results ({self.total_processed}/{self._total_applicants})"
+                )
+        return pending
+    
+    def _make_executor(self, task_count: int) -> Executor:
         """
-        # Check cache first
-        if applicant['folder_path'] in self.cache:
-            res = self.cache[applicant['folder_path']]
-            # Force name inheritance from current folder name, even for cached results
-            if 'fields' in res:
-                res['fields']['NAME'] = applicant['applicant_name'].upper()
-            return res
-
-        result = {
-            'applicant_name': applicant['applicant_name'],
-            'folder_path': applicant['folder_path'],
-            'extraction_status': 'pending',
-            'error_message': None,
-            'fields': {},
-        }
-        logger.info(f"Processing applicant: {applicant['applicant_name']}")
-        
-        # Check if form exists
-        if not applicant['application_form']:
-            msg = "Application form not found in folder. Manually extract information from CV if available."
-            result.update({
-                'extraction_status': 'no_form',
-                'error_message': msg,
-                'errors': [msg],
-                'fields': {
-                    'NAME': applicant['applicant_name'],
-                    'POSITION CODE': self.extractor.default_position_code,
-                    'GENDER': '', 'INT/EXT': self.extractor.default_int_ext,
-                    'DOB': '', 'AGE': '', 'NATIONALITY': '',
-                    'EXP START (YEAR)': '', 'EXPERIENCE(Years)': '',
-                    'QUALIFICATIONS': '',
-                }
-            })
-            return result
+        Create the worker pool for a batch according to executor_mode.
         
-        try:
-            # Extract data from form
-            extraction = self.extractor.extract_from_file(applicant['application_form'])
-            
-            result['extraction_status'] = extraction['extraction_status']
-            result['error_message'] = extraction['error_message']
-            result['errors'] = extraction.get('errors', [])
-            result['fields'] = extraction['fields']
-            result['file_name'] = extraction['file_name']
-            
-            # ALWAYS inherit name from folder as per user request
-            result['fields']['NAME'] = applicant['applicant_name'].upper()
-            
-        except Exception as e:
-            logger.error(f"Error extracting from {applicant['application_form']}: {e}")
-            result['extraction_status'] = 'error'
-            result['errors'] = [str(e)]
-            result['fields'] = {
-                'NAME': applicant['applicant_name'],
-                'POSITION CODE': self.extractor.default_position_code,
-                'GENDER': '', 'INT/EXT': self.extractor.default_int_ext,
-                'DOB': '', 'AGE': '', 'NATIONALITY': '',
-                'EXP START (YEAR)': '', 'EXPERIENCE(Years)': '', 'QUALIFICATIONS': '',
-            }
-        
-        return result
+        Processes sidestep the GIL for CPU-bound PDF/OCR extraction but cost a
+        process start each, so 'auto' only uses them for larger batches.
+        """
+        use_processes = (
+            self.executor_mode == 'processes'
+            or (self.executor_mode == 'auto' and task_count > self.AUTO_PROCESS_THRESHOLD)
+        )
+        if use_processes:
+            logger.info(f"Using process pool with {self.max_workers} workers")
+            return ProcessPoolExecutor(max_workers=self.max_workers)
+        return WorkStealingPool(max_workers=self.max_workers)
     
     def _get_stats(self, elapsed_time: float) -> Dict:
         """Get processing statistics."""
@@ -271,22 +724,78 @@ class ApplicationProcessor:
             'rate': round(self.total_processed / elapsed_time, 2) if elapsed_time > 0 else 0,
         }
     
+    def _add_error(self, error: Dict):
+        """Record an error entry, streaming it to the error log when one is open."""
+        self.error_count += 1
+        self.errors.append(error)
+        if self._error_fh:
+            try:
+                self._error_fh.write(self._format_error(self.error_count, error))
+            except OSError as e:
+                logger.warning(f"Failed to write error log: {e}")
+    
+    def _open_error_log(self, error_log_path: Optional[str]):
+        """Start streaming errors to error_log_path, or keep them all in memory if None."""
+        self._close_error_log()
+        self._error_log_path = None
+        if not error_log_path:
+            self.errors = []
+            return
+        
+        try:
+            self._error_fh = open(error_log_path, 'w', encoding='utf-8')
+            self._error_fh.write(self._error_log_header())
+            self._error_log_path = error_log_path
+            self.errors = deque(maxlen=self.ERROR_BUFFER_SIZE)
+        except OSError as e:
+            logger.warning(f"Failed to open error log: {e}")
+            self._error_fh = None
+            self.errors = []
+    
+    def _close_error_log(self):
+        """Write the error total and close the streamed error log, if open."""
+        if self._error_fh:
+            try:
+                self._error_fh.write(f"Total Errors: {self.error_count}\n")
+                self._error_fh.close()
+            except OSError as e:
+                logger.warning(f"Failed to close error log: {e}")
+            self._error_fh = None
+    
+    def _error_log_header(self) -> str:
+        """Banner at the top of an error log."""
+        return self._ERROR_LOG_TITLE + f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    
+    def _format_error(self, idx: int, error: Dict) -> str:
+        """Format one numbered error entry for the error log."""
+        lines = [f"{idx}. {error['applicant']}\n"]
+        if isinstance(error['error'], list):
+            lines.extend(f"   - {e}\n" for e in error['error'])
+        else:
+            lines.append(f"   - {error['error']}\n")
+        lines.append("\n")
+        return ''.join(lines)
+    
     def export_error_log(self, output_path: str):
-        """Export error log to text file."""
+        """
+        Export error log to text file.
+        
+        If the last batch streamed its errors to a log, that log is copied
+        (or left alone when it is output_path), since only the latest errors
+        are held in memory.
+        """
+        if self._error_log_path and self._error_fh is None:
+            if os.path.abspath(output_path) != os.path.abspath(self._error_log_path):
+                shutil.copyfile(self._error_log_path, output_path)
+            logger.info(f"Error log exported to {output_path}")
+            return
+        
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("ECOWAS Application Processor - Error Log\n")
-            f.write("=" * 60 + "\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+            f.write(self._error_log_header())
             
             f.write(f"Total Errors: {len(self.errors)}\n\n")
             
             for idx, error in enumerate(self.errors, start=1):
-                f.write(f"{idx}. {error['applicant']}\n")
-                if isinstance(error['error'], list):
-                    for e in error['error']:
-                        f.write(f"   - {e}\n")
-                else:
-                    f.write(f"   - {error['error']}\n")
-                f.write("\n")
+                f.write(self._format_error(idx, error))
         
         logger.info(f"Error log exported to {output_path}")
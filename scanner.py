@@ -3,13 +3,28 @@ File system operations for scanning applicant folders.
 """
 
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import List, NamedTuple, Optional, Dict
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def _ext(path: str) -> str:
+    """Lower-cased extension of a file path, e.g. '.pdf' (no Path object needed)."""
+    return os.path.splitext(path)[1].lower()
+
+
+class Applicant(NamedTuple):
+    """An applicant folder found by the scanner (application_form is None when missing)."""
+    
+    folder_path: str
+    applicant_name: str
+    application_form: Optional[str]
+
+
 class FolderScanner:
     """Scans parent folder and locates application forms."""
     
@@ -20,12 +35,17 @@ class FolderScanner:
         'applicant form',
     ]
     
-    SUPPORTED_EXTENSIONS = ['.pdf', '.docx', '.doc', '.jpg', '.jpeg', '.png', '.tiff', '.bmp']
+    # Every keyword contains 'form' or 'application'; spaces may be dropped by the compressed match
+    _KEYWORD_HINT = re.compile(r'f *o *r *m|a *p *p *l *i *c *a *t *i *o *n')
+    
+    SUPPORTED_EXTENSIONS = frozenset({'.pdf', '.docx', '.doc', '.jpg', '.jpeg', '.png', '.tiff', '.bmp'})
+    
+    SCAN_WORKERS = 16  # Folders searched for a form concurrently (I/O bound)
     
     def __init__(self):
         pass
     
-    def scan_folders(self, parent_folder: str) -> List[Dict]:
+    def scan_folders(self, parent_folder: str) -> List[Applicant]:
         """
         Scan parent folder for applicant subfolders.
         
@@ -33,7 +53,7 @@ class FolderScanner:
             parent_folder: Path to parent folder containing applicant folders
             
         Returns:
-            List of dictionaries with applicant folder info
+            List of Applicant records, sorted by folder name
         """
         parent_path = Path(parent_folder)
         
@@ -43,30 +63,20 @@ class FolderScanner:
         if not parent_path.is_dir():
             raise ValueError(f"Path is not a directory: {parent_folder}")
         
-        applicants = []
-        
         # Get all subdirectories and sort alphabetically by name
-        folders = [item for item in parent_path.iterdir() if item.is_dir()]
+        # (scandir entries carry the file type, so no extra stat per folder)
+        with os.scandir(parent_path) as it:
+            folders = [entry for entry in it if entry.is_dir()]
         folders.sort(key=lambda x: x.name.lower())
         
-        for item in folders:
-            applicant_info = {
-                'folder_path': str(item),
-                'applicant_name': item.name,
-                'application_form': None,
-                'status': 'pending',
-                'error': None,
-            }
-                
-            # Try to find application form
-            form_path = self.find_application_form(str(item))
-            if form_path:
-                applicant_info['application_form'] = form_path
-            else:
-                applicant_info['status'] = 'no_form'
-                applicant_info['error'] = 'Application form not found'
-            
-            applicants.append(applicant_info)
+        # Look for forms concurrently; on network shares each folder is latency bound
+        with ThreadPoolExecutor(max_workers=self.SCAN_WORKERS) as executor:
+            forms = list(executor.map(self.find_application_form, [entry.path for entry in folders]))
+        
+        applicants = [
+            Applicant(entry.path, entry.name, form_path)
+            for entry, form_path in zip(folders, forms)
+        ]
         
         logger.info(f"Found {len(applicants)} applicant folders")
         return applicants
@@ -86,52 +96,67 @@ class FolderScanner:
         Returns:
             Path to application form or None if not found
         """
-        folder = Path(folder_path)
-        
-        if not folder.exists() or not folder.is_dir():
+        try:
+            it = os.scandir(folder_path)
+        except OSError:
+            # Missing or not a directory
             return None
         
         # Collect all files with supported extensions
         candidates = []
         
-        for file in folder.iterdir():
-            if file.is_file() and file.suffix.lower() in self.SUPPORTED_EXTENSIONS:
-                file_name_lower = file.stem.lower()
+        with it:
+            for entry in it:
+                file_name_lower, ext = os.path.splitext(entry.name.lower())
+                if ext not in self.SUPPORTED_EXTENSIONS or not entry.is_file():
+                    continue
                 
-                # Score based on keyword matches
-                score = 0
-                for keyword in self.APPLICATION_FORM_NAMES:
-                    if keyword in file_name_lower:
-                        score += 3  # High weight for exact keyword
-                    elif keyword in file_name_lower.replace(' ', ''):
-                         score += 1 # Lower weight for partial/compressed match (e.g., applicationform)
-
-                # Get file metadata
-                try:
-                    stats = file.stat()
-                    size = stats.st_size
-                    mtime = stats.st_mtime
-                except Exception:
-                    size = 0
-                    mtime = 0
-
                 candidates.append({
-                    'path': str(file),
-                    'score': score,
-                    'size': size,
-                    'mtime': mtime
+                    'path': entry.path,
+                    'entry': entry,
+                    'score': self._score_name(file_name_lower),
+                    'size': 0,
+                    'mtime': 0
                 })
         
+        # Size and mtime only break score ties, so only stat the top scorers
+        if candidates:
+            top_score = max(c['score'] for c in candidates)
+            candidates = [c for c in candidates if c['score'] == top_score]
+            if len(candidates) == 1:
+                return candidates[0]['path']
+            
+            # Get file metadata
+            for c in candidates:
+                try:
+                    stats = c['entry'].stat()
+                    c['size'] = stats.st_size
+                    c['mtime'] = stats.st_mtime
+                except Exception:
+                    pass
+        
         # Return highest scoring file
         if candidates:
-            # Sort by: Score (desc), Size (desc), Mtime (desc)
+            # Best by: Score, then Size, then Mtime
             # We prioritize explicit keywords first. If tied, pick largest file (likely the scan).
-            # If still tied, pick newest.
-            candidates.sort(key=lambda x: (x['score'], x['size'], x['mtime']), reverse=True)
-            return candidates[0]['path']
+            # If still tied, pick newest (first found wins a full tie, as with a stable sort).
+            best = max(candidates, key=lambda x: (x['score'], x['size'], x['mtime']))
+            return best['path']
         
         return None
     
+    def _score_name(self, file_name_lower: str) -> int:
+        """Score a lower-cased file stem on keyword matches (names with no keyword at all score 0)."""
+        score = 0
+        if self._KEYWORD_HINT.search(file_name_lower):
+            compressed = file_name_lower.replace(' ', '')
+            for keyword in self.APPLICATION_FORM_NAMES:
+                if keyword in file_name_lower:
+                    score += 3  # High weight for exact keyword
+                elif keyword in compressed:
+                    score += 1  # Lower weight for partial/compressed match (e.g., applicationform)
+        return score
+    
     def get_folder_statistics(self, parent_folder: str) -> Dict:
         """
         Get statistics about the folder structure.
@@ -143,15 +168,15 @@ class FolderScanner:
         
         stats = {
             'total_folders': len(applicants),
-            'with_forms': sum(1 for a in applicants if a['application_form']),
-            'without_forms': sum(1 for a in applicants if not a['application_form']),
+            'with_forms': sum(1 for a in applicants if a.application_form),
+            'without_forms': sum(1 for a in applicants if not a.application_form),
             'file_types': {},
         }
         
         # Count file types
         for applicant in applicants:
-            if applicant['application_form']:
-                ext = Path(applicant['application_form']).suffix.lower()
+            if applicant.application_form:
+                ext = _ext(applicant.application_form)
                 stats['file_types'][ext] = stats['file_types'].get(ext, 0) + 1
         
         return stats